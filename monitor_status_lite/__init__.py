@@ -9,5 +9,6 @@ __plugin_meta__ = PluginMetadata(
     author="MoFox-Studio",
     license="GPL-v3.0-or-later",
     keywords=["monitor", "status", "lite"],
-    python_dependencies=["psutil", "Pillow"]
+    # 可替换为 API 兼容的 pillow-simd 以加速绘图，见 README
+    python_dependencies=["psutil", "Pillow", "numpy"]
 )
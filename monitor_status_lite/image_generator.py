@@ -8,10 +8,26 @@ from datetime import datetime
 from PIL import Image, ImageDraw, ImageFont
 
 
+class _CanvasDraw(ImageDraw.ImageDraw):
+    """保留目标图片引用的 ImageDraw，绘制函数可直接 paste 预渲染图块"""
+
+    def __init__(self, image: Image.Image):
+        super().__init__(image)
+        self.image = image
+
+
 class MonitorImageGenerator:
     """生成状态图片"""
 
-    def __init__(self):
+    # 支持的输出格式 (别名 -> Pillow 格式名)
+    OUTPUT_FORMATS: dict[str, str] = {"JPEG": "JPEG", "JPG": "JPEG", "PNG": "PNG"}
+
+    def __init__(self, output_format: str = "JPEG"):
+        # 输出格式: JPEG (默认，编码最快) 或 PNG (客户端不支持 JPEG 时使用)
+        try:
+            self.output_format = self.OUTPUT_FORMATS[output_format.upper()]
+        except KeyError:
+            raise ValueError(f"不支持的图片格式: {output_format} (可选: JPEG, PNG)") from None
         self.width = 1100
         self.height = 920
         self.bg_color = (22, 22, 28)  # 深色背景
@@ -40,94 +56,117 @@ class MonitorImageGenerator:
             self.font_small = ImageFont.load_default()
             self.font_value = ImageFont.load_default()
 
+        # 圆角矩形图块缓存: (宽, 高, 圆角, 颜色) -> RGBA 图块; (高, 圆角, 颜色) -> (左端, 右端)
+        self._tile_cache: dict[tuple, Image.Image] = {}
+        self._cap_cache: dict[tuple, tuple] = {}
+
+        # 行标签字形遮罩缓存: 文字 -> (L 遮罩, 左偏移, 上偏移)
+        self._label_cache: dict[str, tuple] = {}
+
+        # 单字符字形缓存: (字体, 字符) -> (L 遮罩, 左偏移, 上偏移, 步进宽度)
+        self._glyph_cache: dict[tuple, tuple] = {}
+        self._kerning_cache: dict[tuple, float] = {}
+        # 使用字形缓存绘制 ASCII 文字的字体 (数值与小字)
+        self._glyph_fonts = (self.font_value, self.font_small)
+        for char in "0123456789-: ":
+            self._glyph(self.font_small, char)
+
+        # 按磁盘数量缓存的静态模板 (背景 + 面板标题 + 卡片 + 卡片标题)
+        self._templates: dict[int, Image.Image] = {}
+        self._get_template(3)
+
     def generate(self, data: dict) -> bytes:
         """生成图片并返回字节"""
-        # 动态计算高度
         disk_count = len(data.get('disks', []))
-        disk_card_height = max(35 * min(disk_count, 5) + 55, 90)
-        self.height = 920 + max(0, (disk_count - 3) * 35)
         
-        image = Image.new("RGB", (self.width, self.height), self.bg_color)
-        draw = ImageDraw.Draw(image)
+        # 背景、面板标题、卡片与卡片标题与数据无关，直接复制预渲染的模板
+        image = self._get_template(disk_count).copy()
+        draw = _CanvasDraw(image)
 
         # 绘制标题区域
         self._draw_header(draw, data)
         
+        # 绘制各卡片内容
+        for _, x, y, width, _, content_func in self._card_layout(disk_count):
+            content_func(draw, x + 18, y + 42, width - 36, data)
+
+        buffer = BytesIO()
+        if self.output_format == "JPEG":
+            # JPEG 编码耗时约为 PNG 路径的 1/4；关闭色度抽样 (4:4:4) 避免彩色小字发糊
+            image.save(buffer, format="JPEG", quality=90, optimize=False, progressive=False, subsampling=0)
+        else:
+            # 界面只有十余种主色 (其余为文字抗锯齿过渡色)，量化为 8 位调色板后
+            # 编码的数据量只有 RGB 的 1/3，量化 + 编码总耗时仍低于直接编码，输出体积减半
+            image = image.quantize(colors=256, method=Image.FASTOCTREE)
+            # 状态图以大块纯色为主，低压缩等级即可得到接近的体积，编码耗时大幅减少
+            image.save(buffer, format="PNG", compress_level=1)
+        return buffer.getvalue()
+
+    def _card_layout(self, disk_count: int) -> list:
+        """计算卡片布局，返回 (标题, x, y, 宽度, 高度, 内容绘制函数) 列表"""
         y_pos = 80
         card_margin = 25
+        card_gap = 12
         card_width = (self.width - card_margin * 3) // 2
+        disk_card_height = max(35 * min(disk_count, 5) + 55, 90)
 
-        # ===== 左侧卡片 =====
-        left_x = card_margin
-        
-        # 系统信息卡片
-        y_pos_left = self._draw_card(draw, "📊 系统信息", left_x, y_pos, card_width, 180, 
-                                      lambda d, x, y, w: self._draw_system_info(d, x, y, w, data))
-        y_pos_left += 12
-        
-        # 资源使用卡片
-        y_pos_left = self._draw_card(draw, "💻 资源使用", left_x, y_pos_left, card_width, 165, 
-                                      lambda d, x, y, w: self._draw_resource_usage(d, x, y, w, data))
-        y_pos_left += 12
-        
-        # 监控统计卡片
-        y_pos_left = self._draw_card(draw, "📈 监控统计", left_x, y_pos_left, card_width, 195, 
-                                      lambda d, x, y, w: self._draw_monitor_stats(d, x, y, w, data))
-        y_pos_left += 12
-        
-        # 消息统计卡片
-        self._draw_card(draw, "💬 消息统计 (24h)", left_x, y_pos_left, card_width, 105, 
-                        lambda d, x, y, w: self._draw_message_stats(d, x, y, w, data))
+        columns = [
+            # ===== 左侧卡片 =====
+            (card_margin, [
+                ("📊 系统信息", 180, self._draw_system_info),
+                ("💻 资源使用", 165, self._draw_resource_usage),
+                ("📈 监控统计", 195, self._draw_monitor_stats),
+                ("💬 消息统计 (24h)", 105, self._draw_message_stats),
+            ]),
+            # ===== 右侧卡片 =====
+            (card_margin * 2 + card_width, [
+                ("🤖 Bot 状态", 195, self._draw_bot_status),
+                ("💾 磁盘空间", disk_card_height, self._draw_disk_info),
+                ("🔌 插件信息", 105, self._draw_plugin_info),
+            ]),
+        ]
 
-        # ===== 右侧卡片 =====
-        right_x = card_margin * 2 + card_width
-        y_pos_right = y_pos
-        
-        # Bot 状态卡片
-        y_pos_right = self._draw_card(draw, "🤖 Bot 状态", right_x, y_pos_right, card_width, 195, 
-                                       lambda d, x, y, w: self._draw_bot_status(d, x, y, w, data))
-        y_pos_right += 12
-        
-        # 磁盘空间卡片
-        y_pos_right = self._draw_card(draw, "💾 磁盘空间", right_x, y_pos_right, card_width, disk_card_height, 
-                                       lambda d, x, y, w: self._draw_disk_info(d, x, y, w, data))
-        y_pos_right += 12
-        
-        # 插件信息卡片
-        self._draw_card(draw, "🔌 插件信息", right_x, y_pos_right, card_width, 105, 
-                        lambda d, x, y, w: self._draw_plugin_info(d, x, y, w, data))
+        layout = []
+        for x, cards in columns:
+            y = y_pos
+            for title, height, content_func in cards:
+                layout.append((title, x, y, card_width, height, content_func))
+                y += height + card_gap
+        return layout
 
-        buffer = BytesIO()
-        image.save(buffer, format="PNG")
-        return buffer.getvalue()
+    def _get_template(self, disk_count: int) -> Image.Image:
+        """获取 (必要时生成) 对应磁盘数量的静态模板"""
+        template = self._templates.get(disk_count)
+        if template is None:
+            # 动态计算高度
+            height = self.height + max(0, (disk_count - 3) * 35)
+            template = Image.new("RGB", (self.width, height), self.bg_color)
+            draw = _CanvasDraw(template)
+            self._draw_title(draw)
+            for title, x, y, width, card_height, _ in self._card_layout(disk_count):
+                self._draw_card(draw, title, x, y, width, card_height)
+            self._templates[disk_count] = template
+        return template
+
+    def _draw_title(self, draw):
+        """绘制标题 (静态，绘制在模板中)"""
+        self._draw_text(draw, "🦊 MoFox-Bot 状态面板", (30, 22), self.font_bold, self.title_color)
 
     def _draw_header(self, draw, data):
         """绘制头部"""
-        # 标题
-        self._draw_text(draw, "🦊 MoFox-Bot 状态面板", (30, 22), self.font_bold, self.title_color)
-        
-        # 时间戳
+        # 时间戳只由数字和分隔符组成，逐字符贴缓存字形
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self._draw_text(draw, current_time, (self.width - 165, 32), self.font_small, self.text_color)
+        self._draw_glyphs(draw, current_time, (self.width - 165, 32), self.font_small, self.text_color)
 
-    def _draw_card(self, draw, title, x, y, width, height, content_func):
-        """绘制卡片"""
+    def _draw_card(self, draw, title, x: int, y: int, width: int, height: int):
+        """绘制卡片背景与标题"""
         # 卡片背景
-        draw.rounded_rectangle(
-            [x, y, x + width, y + height],
-            radius=10,
-            fill=self.card_bg
-        )
+        self._fill_rounded_rect(draw, [x, y, x + width, y + height], 10, self.card_bg)
         
         # 卡片标题
         self._draw_text(draw, title, (x + 18, y + 12), self.font_title, self.title_color)
-        
-        # 绘制内容
-        content_func(draw, x + 18, y + 42, width - 36)
-        
-        return y + height
 
-    def _draw_system_info(self, draw, x, y, width, data):
+    def _draw_system_info(self, draw, x: int, y: int, width: int, data: dict):
         """绘制系统信息"""
         items = [
             ("操作系统", f"{data.get('os_type', 'N/A')} {data.get('os_version', '')}"),
@@ -139,7 +178,7 @@ class MonitorImageGenerator:
         for i, (label, value) in enumerate(items):
             self._draw_info_row(draw, label, str(value), x, y + i * 30, width)
 
-    def _draw_resource_usage(self, draw, x, y, width, data):
+    def _draw_resource_usage(self, draw, x: int, y: int, width: int, data: dict):
         """绘制资源使用"""
         # CPU
         cpu = data.get('cpu_percent', 0)
@@ -154,10 +193,11 @@ class MonitorImageGenerator:
         bot_mem = data.get('bot_memory_mb', 0)
         self._draw_info_row(draw, "Bot占用", f"{bot_mem:.1f} MB", x, y + 95, width)
 
-    def _draw_bot_status(self, draw, x, y, width, data):
+    def _draw_bot_status(self, draw, x: int, y: int, width: int, data: dict):
         """绘制Bot状态"""
         bot_status = data.get('bot_status', '未知')
-        status_color = self.success_color if bot_status == '运行中' else self.danger_color
+        # 状态颜色由调用方在数据采集阶段给出，未提供时使用中性的数值颜色
+        status_color = data.get('bot_status_color', self.value_color)
         
         items = [
             ("运行状态", bot_status, status_color),
@@ -169,14 +209,14 @@ class MonitorImageGenerator:
         
         for i, item in enumerate(items):
             label, value, color = item
-            self._draw_info_row_colored(draw, label, value, x, y + i * 28, width, color)
+            self._draw_info_row(draw, label, value, x, y + i * 28, width, value_color=color)
 
-    def _draw_disk_info(self, draw, x, y, width, data):
+    def _draw_disk_info(self, draw, x: int, y: int, width: int, data: dict):
         """绘制磁盘信息"""
         disks = data.get('disks', [])
         
         if not disks:
-            self._draw_text(draw, "无可用磁盘信息", (x, y), self.font_main, self.text_color)
+            self._draw_label(draw, "无可用磁盘信息", (x, y), self.text_color)
             return
         
         for i, disk in enumerate(disks[:5]):  # 最多显示5个
@@ -190,14 +230,16 @@ class MonitorImageGenerator:
             
             self._draw_mini_progress(draw, label, percent, x, y + i * 32, width - 15, detail)
 
-    def _draw_monitor_stats(self, draw, x, y, width, data):
+    def _draw_monitor_stats(self, draw, x: int, y: int, width: int, data: dict):
         """绘制监控统计（数据来自外部监控程序）"""
         # 监控程序状态
-        monitor_running = data.get('monitor_running', False)
-        monitor_status = "运行中" if monitor_running else "未运行"
-        status_color = self.success_color if monitor_running else self.danger_color
+        # 状态文字与颜色由调用方在数据采集阶段给出
+        monitor_status = data.get('monitor_status')
+        if monitor_status is None:
+            monitor_status = "运行中" if data.get('monitor_running', False) else "未运行"
+        status_color = data.get('monitor_running_color', self.value_color)
         
-        self._draw_text(draw, "监控程序", (x, y), self.font_main, self.text_color)
+        self._draw_label(draw, "监控程序", (x, y), self.text_color)
         self._draw_text(draw, monitor_status, (x + 85, y), self.font_value, status_color)
         
         items = [
@@ -216,7 +258,7 @@ class MonitorImageGenerator:
         for i, (label, value) in enumerate(items):
             self._draw_info_row(draw, label, value, x, y + 28 + i * 28, width)
 
-    def _draw_message_stats(self, draw, x, y, width, data):
+    def _draw_message_stats(self, draw, x: int, y: int, width: int, data: dict):
         """绘制消息统计"""
         items = [
             ("接收消息", str(data.get('total_messages_24h', 0)), self.cyan_color),
@@ -224,9 +266,9 @@ class MonitorImageGenerator:
         ]
         
         for i, (label, value, color) in enumerate(items):
-            self._draw_info_row_colored(draw, label, value, x, y + i * 28, width, color)
+            self._draw_info_row(draw, label, value, x, y + i * 28, width, value_color=color)
 
-    def _draw_plugin_info(self, draw, x, y, width, data):
+    def _draw_plugin_info(self, draw, x: int, y: int, width: int, data: dict):
         """绘制插件信息"""
         plugin_count = data.get('plugin_count', 0)
         enabled_count = data.get('enabled_plugin_count', plugin_count)
@@ -237,7 +279,7 @@ class MonitorImageGenerator:
         ]
         
         for i, (label, value, color) in enumerate(items):
-            self._draw_info_row_colored(draw, label, value, x, y + i * 28, width, color)
+            self._draw_info_row(draw, label, value, x, y + i * 28, width, value_color=color)
 
     def _get_usage_color(self, percent: float) -> tuple:
         """根据使用率返回颜色"""
@@ -248,42 +290,125 @@ class MonitorImageGenerator:
         else:
             return self.danger_color
 
+    def _rounded_tile(self, width: int, height: int, radius: int, color) -> Image.Image:
+        """获取 (必要时生成) 圆角矩形 RGBA 图块"""
+        key = (width, height, radius, color)
+        tile = self._tile_cache.get(key)
+        if tile is None:
+            tile = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+            ImageDraw.Draw(tile).rounded_rectangle([0, 0, width - 1, height - 1], radius=radius, fill=color)
+            self._tile_cache[key] = tile
+        return tile
+
+    def _rounded_caps(self, height: int, radius: int, color) -> tuple:
+        """获取 (必要时生成) 圆角矩形的左右端图块"""
+        key = (height, radius, color)
+        caps = self._cap_cache.get(key)
+        if caps is None:
+            tile = self._rounded_tile(radius * 2 + 1, height, radius, color)
+            caps = (
+                tile.crop((0, 0, radius, height)),
+                tile.crop((radius + 1, 0, radius * 2 + 1, height)),
+            )
+            self._cap_cache[key] = caps
+        return caps
+
+    def _fill_rounded_rect(self, draw, box, radius: int, color):
+        """绘制圆角矩形，效果等同 draw.rounded_rectangle(box, radius=radius, fill=color)"""
+        x0, y0, x1, y1 = box
+        width = x1 - x0 + 1
+        height = y1 - y0 + 1
+        image = draw.image
+
+        if width <= radius * 2 + 1:
+            tile = self._rounded_tile(width, height, radius, color)
+            image.paste(tile, (x0, y0), tile)
+            return
+
+        # 两端贴缓存的圆角图块，中间部分直接纯色填充，宽度可变也无需重新生成图块
+        left, right = self._rounded_caps(height, radius, color)
+        image.paste(left, (x0, y0), left)
+        image.paste(color, (x0 + radius, y0, x1 - radius + 1, y1 + 1))
+        image.paste(right, (x1 - radius + 1, y0), right)
+
     def _draw_text(self, draw, text, position, font, color):
-        draw.text(position, str(text), font=font, fill=color)
+        text = str(text)
+        # 数值类文字几乎只由 ASCII 字符组成，走字形缓存；中文等其他文字交给 FreeType 直接绘制
+        if font in self._glyph_fonts and text.isascii():
+            self._draw_glyphs(draw, text, position, font, color)
+        else:
+            draw.text(position, text, font=font, fill=color)
+
+    def _glyph(self, font, char) -> tuple:
+        """获取 (必要时生成) 单个字符的字形: (L 遮罩或 None, 左偏移, 上偏移, 步进宽度)"""
+        key = (font, char)
+        glyph = self._glyph_cache.get(key)
+        if glyph is None:
+            left, top, right, bottom = font.getbbox(char)
+            mask = None
+            if right > left and bottom > top:
+                mask = Image.new("L", (right - left, bottom - top))
+                ImageDraw.Draw(mask).text((-left, -top), char, font=font, fill=255)
+            glyph = (mask, left, top, font.getlength(char))
+            self._glyph_cache[key] = glyph
+        return glyph
+
+    def _kerning(self, font, left, right) -> float:
+        """获取 (必要时计算) 字符对的字距调整量"""
+        key = (font, left, right)
+        kerning = self._kerning_cache.get(key)
+        if kerning is None:
+            kerning = font.getlength(left + right) - font.getlength(left) - font.getlength(right)
+            self._kerning_cache[key] = kerning
+        return kerning
+
+    def _draw_glyphs(self, draw, text, position, font, color):
+        """逐字符贴缓存字形绘制文字，用于字符集很小的文本 (ASCII 数值、时间戳)"""
+        x, y = position
+        prev = None
+        for char in text:
+            if prev is not None:
+                x += self._kerning(font, prev, char)
+            mask, left, top, advance = self._glyph(font, char)
+            if mask is not None:
+                draw.image.paste(color, (round(x) + left, y + top), mask)
+            x += advance
+            prev = char
 
-    def _draw_info_row(self, draw, label, value, x, y, width):
-        """绘制信息行"""
-        self._draw_text(draw, label, (x, y), self.font_main, self.text_color)
-        self._draw_text(draw, value, (x + 85, y), self.font_value, self.value_color)
+    def _draw_label(self, draw, text, position, color):
+        """绘制行标签；标签取值固定，渲染后的字形遮罩缓存复用，之后只需贴图"""
+        cached = self._label_cache.get(text)
+        if cached is None:
+            left, top, right, bottom = self.font_main.getbbox(text)
+            mask = Image.new("L", (right - left, bottom - top))
+            ImageDraw.Draw(mask).text((-left, -top), text, font=self.font_main, fill=255)
+            cached = (mask, left, top)
+            self._label_cache[text] = cached
+        mask, left, top = cached
+        draw.image.paste(color, (position[0] + left, position[1] + top), mask)
 
-    def _draw_info_row_colored(self, draw, label, value, x, y, width, value_color):
-        """绘制带颜色的信息行"""
-        self._draw_text(draw, label, (x, y), self.font_main, self.text_color)
+    def _draw_info_row(self, draw, label, value, x: int, y: int, width: int, value_color=None):
+        """绘制信息行，未指定 value_color 时使用默认数值颜色"""
+        value_color = value_color or self.value_color
+        self._draw_label(draw, label, (x, y), self.text_color)
         self._draw_text(draw, value, (x + 85, y), self.font_value, value_color)
 
-    def _draw_progress_bar(self, draw, label, percentage, x, y, width, color, extra_text=""):
+    def _draw_progress_bar(self, draw, label, percentage: float, x: int, y: int, width: int, color, extra_text=""):
         """绘制进度条"""
         bar_height = 18
         bar_width = width - 80
         
         # 标签
-        self._draw_text(draw, label, (x, y), self.font_main, self.text_color)
+        self._draw_label(draw, label, (x, y), self.text_color)
         
         # 背景条
         bar_x = x + 50
-        draw.rounded_rectangle(
-            [bar_x, y, bar_x + bar_width, y + bar_height],
-            radius=4,
-            fill=self.bar_bg_color
-        )
+        self._fill_rounded_rect(draw, [bar_x, y, bar_x + bar_width, y + bar_height], 4, self.bar_bg_color)
         
-        # 前景条
-        fill_width = max(int(bar_width * (percentage / 100)), 6)
-        draw.rounded_rectangle(
-            [bar_x, y, bar_x + fill_width, y + bar_height],
-            radius=4,
-            fill=color
-        )
+        # 前景条 (占用率为 0 或 NaN 时不绘制)
+        if percentage > 0.5:
+            fill_width = int(bar_width * percentage * 0.01)
+            self._fill_rounded_rect(draw, [bar_x, y, bar_x + fill_width, y + bar_height], 4, color)
         
         # 百分比
         self._draw_text(draw, f"{percentage:.0f}%", (bar_x + bar_width + 8, y), self.font_small, self.value_color)
@@ -292,31 +417,24 @@ class MonitorImageGenerator:
         if extra_text:
             self._draw_text(draw, extra_text, (x, y + 22), self.font_small, self.text_color)
 
-    def _draw_mini_progress(self, draw, label, percentage, x, y, width, detail=""):
+    def _draw_mini_progress(self, draw, label, percentage: float, x: int, y: int, width: int, detail=""):
         """绘制迷你进度条"""
         bar_height = 14
         label_width = 30
         bar_width = width - label_width - 110
         
         # 标签
-        self._draw_text(draw, label, (x, y), self.font_main, self.value_color)
+        self._draw_label(draw, label, (x, y), self.value_color)
         
         # 背景条
         bar_x = x + label_width
-        draw.rounded_rectangle(
-            [bar_x, y + 2, bar_x + bar_width, y + bar_height],
-            radius=3,
-            fill=self.bar_bg_color
-        )
+        self._fill_rounded_rect(draw, [bar_x, y + 2, bar_x + bar_width, y + bar_height], 3, self.bar_bg_color)
         
-        # 前景条
-        color = self._get_usage_color(percentage)
-        fill_width = max(int(bar_width * (percentage / 100)), 4)
-        draw.rounded_rectangle(
-            [bar_x, y + 2, bar_x + fill_width, y + bar_height],
-            radius=3,
-            fill=color
-        )
+        # 前景条 (占用率为 0 或 NaN 时不绘制)
+        if percentage > 0.5:
+            color = self._get_usage_color(percentage)
+            fill_width = int(bar_width * percentage * 0.01)
+            self._fill_rounded_rect(draw, [bar_x, y + 2, bar_x + fill_width, y + bar_height], 3, color)
         
         # 详情
         self._draw_text(draw, f"{percentage:.0f}% {detail}", (bar_x + bar_width + 6, y), self.font_small, self.text_color)
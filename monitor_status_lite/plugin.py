@@ -10,14 +10,11 @@ import sys
 import time
 import os
 import asyncio
-from collections import deque
 from typing import ClassVar, Type
 
+import numpy as np
 import psutil
 
-# 全局内存历史记录 (保留最近60个点，每分钟一个)
-MEMORY_HISTORY = deque(maxlen=60)
-
 from src.config.config import global_config
 from src.plugin_system.apis import plugin_manage_api
 from src.plugin_system import register_plugin
@@ -35,17 +32,65 @@ except ImportError:
     IMAGE_GENERATOR_AVAILABLE = False
     print("[MonitorStatusLite] 图片生成器加载失败，将只提供文字模式")
 
+# 共享的图片生成器实例，首次生成图片时创建 (字体只加载一次)
+_GENERATOR = None
+
+
+def _get_generator(output_format: str) -> "MonitorImageGenerator":
+    """获取共享的图片生成器；创建失败时抛出异常，由调用方回退到文字版"""
+    global _GENERATOR
+    if _GENERATOR is None:
+        _GENERATOR = MonitorImageGenerator(output_format)
+    return _GENERATOR
+
 
 # ==================== 工具函数 ====================
+# 当前进程句柄，psutil.Process 可长期复用，避免每次采样重新构造
+_SELF_PROC = psutil.Process(os.getpid())
+
+
+class _MemoryHistory:
+    """定长内存历史环形缓冲区，数据存放在预分配的 float32 数组中"""
+
+    def __init__(self, size: int):
+        self._buf = np.zeros(size, dtype=np.float32)
+        self._write = 0
+        self._filled = 0
+
+    def __len__(self) -> int:
+        return self._filled
+
+    def append(self, value: float):
+        size = self._buf.shape[0]
+        self._buf[self._write] = value
+        self._write = (self._write + 1) % size
+        self._filled = min(size, self._filled + 1)
+
+    def view(self) -> np.ndarray:
+        """按时间顺序 (旧 -> 新) 返回已记录的数据"""
+        if self._filled < self._buf.shape[0]:
+            return self._buf[:self._filled]
+        return np.concatenate((self._buf[self._write:], self._buf[:self._write]))
+
+
+# 全局内存历史记录 (保留最近60个点，每分钟一个)
+MEMORY_HISTORY = _MemoryHistory(60)
+
+
+def _fmt_duration_parts(seconds: int) -> tuple:
+    """将秒数拆分为 (天, 小时, 分, 秒)"""
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    return days, hours, minutes, secs
+
+
 def format_duration(seconds: int) -> str:
     """格式化时间间隔"""
     if seconds < 0:
         return "N/A"
     
-    days = seconds // 86400
-    hours = (seconds % 86400) // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
+    days, hours, minutes, secs = _fmt_duration_parts(seconds)
     
     parts = []
     if days > 0:
@@ -60,6 +105,18 @@ def format_duration(seconds: int) -> str:
     return "".join(parts[:3])
 
 
+def _trend_stats(arr: np.ndarray) -> tuple:
+    """计算内存趋势统计，返回 (当前, 平均, 峰值, 谷值, 最近5点均值, 最早5点均值)"""
+    return (
+        float(arr[-1]),
+        float(arr.mean()),
+        float(arr.max()),
+        float(arr.min()),
+        float(arr[-5:].mean()),
+        float(arr[:5].mean()),
+    )
+
+
 def get_full_os_version() -> str:
     """获取完整的操作系统版本"""
     try:
@@ -73,25 +130,32 @@ def get_full_os_version() -> str:
         return platform.release()
 
 
-def get_disk_info() -> list:
-    """获取所有磁盘信息"""
+async def get_disk_info() -> list:
+    """获取所有磁盘信息 (各挂载点并发查询)"""
     disks = []
     try:
-        for part in psutil.disk_partitions():
-            try:
-                if 'cdrom' in part.opts.lower() or part.fstype == '':
-                    continue
-                usage = psutil.disk_usage(part.mountpoint)
-                disks.append({
-                    "mountpoint": part.mountpoint,
-                    "percent": usage.percent,
-                    "total_gb": usage.total / (1024**3),
-                    "used_gb": usage.used / (1024**3),
-                    "free_gb": usage.free / (1024**3)
-                })
-            except:
-                pass
-    except:
+        parts = [
+            part for part in await asyncio.to_thread(_get_partitions)
+            if 'cdrom' not in part.opts.lower() and part.fstype != ''
+        ]
+        # disk_usage 是阻塞的系统调用，放到线程中并发执行
+        results = await asyncio.gather(
+            *(asyncio.to_thread(psutil.disk_usage, part.mountpoint) for part in parts),
+            return_exceptions=True
+        )
+        for part, usage in zip(parts, results):
+            if isinstance(usage, (psutil.Error, OSError)):
+                continue
+            if isinstance(usage, BaseException):
+                raise usage
+            disks.append({
+                "mountpoint": part.mountpoint,
+                "percent": usage.percent,
+                "total_gb": usage.total / (1024**3),
+                "used_gb": usage.used / (1024**3),
+                "free_gb": usage.free / (1024**3)
+            })
+    except (psutil.Error, OSError):
         pass
     return disks
 
@@ -99,18 +163,93 @@ def get_disk_info() -> list:
 def get_bot_process_info() -> dict:
     """获取Bot进程信息"""
     try:
-        process = psutil.Process(os.getpid())
-        return {
-            "pid": process.pid,
-            "memory_mb": process.memory_info().rss / 1024 / 1024,
-            "threads": process.num_threads(),
-            "create_time": process.create_time(),
-            "uptime": time.time() - process.create_time()
-        }
-    except:
+        # oneshot 内多个查询共用一次系统调用结果
+        with _SELF_PROC.oneshot():
+            create_time = _SELF_PROC.create_time()
+            return {
+                "pid": _SELF_PROC.pid,
+                "memory_mb": _SELF_PROC.memory_info().rss / 1024 / 1024,
+                "threads": _SELF_PROC.num_threads(),
+                "create_time": create_time,
+                "uptime": time.time() - create_time
+            }
+    except psutil.Error:
         return {}
 
 
+# ==================== 资源采样缓存 ====================
+STATS_TTL = 2.0  # 资源数据缓存时间 (秒)
+PARTITIONS_TTL = 60.0  # 分区列表很少变化，单独缓存更久
+STATS_SAMPLE_INTERVAL = 2.0  # 后台 CPU/内存 采样间隔 (秒)
+MEMORY_RECORD_INTERVAL = 60.0  # 内存历史记录间隔 (秒)
+
+
+class _StatsCache:
+    """资源采样缓存，短时间内的多次查询共用同一次采样"""
+
+    def __init__(self):
+        self.ts = float("-inf")
+        self.cpu = 0.0
+        self.ram = None
+        self.sample_ts = float("-inf")  # CPU/内存最近一次采样时间
+        self.boot_time = 0.0
+        self.disks: list = []
+        self.bot_info: dict = {}
+        self.partitions: list = []
+        self.partitions_ts = float("-inf")
+        self.lock = asyncio.Lock()
+
+
+_STATS = _StatsCache()
+
+# cpu_percent(interval=None) 返回与上一次调用之间的占用率，先调用一次建立基准
+psutil.cpu_percent(interval=None)
+
+
+def _get_partitions() -> list:
+    """获取磁盘分区列表 (带缓存)"""
+    now = time.monotonic()
+    if now - _STATS.partitions_ts >= PARTITIONS_TTL:
+        _STATS.partitions = psutil.disk_partitions()
+        _STATS.partitions_ts = now
+    return _STATS.partitions
+
+
+def _sample_cpu_ram():
+    """采样CPU与内存占用率并写入缓存"""
+    _STATS.cpu = psutil.cpu_percent(interval=None)
+    _STATS.ram = psutil.virtual_memory()
+    _STATS.sample_ts = time.monotonic()
+
+
+def _collect_sync() -> tuple:
+    """同步采集开机时间与Bot进程信息 (在线程中执行)"""
+    if time.monotonic() - _STATS.sample_ts >= STATS_SAMPLE_INTERVAL * 2:
+        # 后台采样任务尚未运行或已停止时直接采集，避免一直返回旧数据
+        _sample_cpu_ram()
+    return psutil.boot_time(), get_bot_process_info()
+
+
+async def get_stats() -> dict:
+    """获取资源使用数据，STATS_TTL 内重复调用直接返回缓存"""
+    async with _STATS.lock:
+        # 并发请求等待同一次采样完成后直接复用结果
+        now = time.monotonic()
+        if now - _STATS.ts >= STATS_TTL:
+            (_STATS.boot_time, _STATS.bot_info), _STATS.disks = await asyncio.gather(
+                asyncio.to_thread(_collect_sync),
+                get_disk_info()
+            )
+            _STATS.ts = time.monotonic()
+    return {
+        "cpu": _STATS.cpu,
+        "ram": _STATS.ram,
+        "boot_time": _STATS.boot_time,
+        "disks": _STATS.disks,
+        "bot_info": _STATS.bot_info,
+    }
+
+
 # ==================== 命令实现 ====================
 
 class StatusCommand(PlusCommand):
@@ -127,26 +266,27 @@ class StatusCommand(PlusCommand):
         """执行命令"""
         # 收集数据
         data = {}
+        stats = await get_stats()
         
         # 系统信息
         data['os_type'] = platform.system()
         data['os_version'] = platform.release()
         data['os_full_version'] = get_full_os_version()
         data['python_version'] = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
-        data['boot_time'] = format_duration(int(time.time() - psutil.boot_time()))
+        data['boot_time'] = format_duration(int(time.time() - stats['boot_time']))
         
         # 资源使用
-        data['cpu_percent'] = psutil.cpu_percent(interval=None)
-        ram = psutil.virtual_memory()
+        data['cpu_percent'] = stats['cpu']
+        ram = stats['ram']
         data['ram_percent'] = ram.percent
         data['ram_used_gb'] = ram.used / (1024**3)
         data['ram_total_gb'] = ram.total / (1024**3)
         
         # 磁盘信息
-        data['disks'] = get_disk_info()
+        data['disks'] = stats['disks']
         
         # Bot 信息
-        bot_info = get_bot_process_info()
+        bot_info = stats['bot_info']
         data['bot_pid'] = bot_info.get('pid', 'N/A')
         data['bot_memory_mb'] = bot_info.get('memory_mb', 0)
         data['bot_threads'] = bot_info.get('threads', 0)
@@ -161,8 +301,16 @@ class StatusCommand(PlusCommand):
         
         if IMAGE_GENERATOR_AVAILABLE:
             try:
+                generator = _get_generator(self.get_config("general.image_format", "JPEG"))
+                
+                # 状态文字与颜色在采集阶段确定，绘制阶段只读取现成的值
+                is_running = data['bot_status'] == "运行中"
+                data['bot_status_color'] = generator.success_color if is_running else generator.danger_color
+                monitor_running = data.get('monitor_running', False)
+                data['monitor_status'] = "运行中" if monitor_running else "未运行"
+                data['monitor_running_color'] = generator.success_color if monitor_running else generator.danger_color
+                
                 # 生成图片
-                generator = MonitorImageGenerator()
                 img_bytes = generator.generate(data)
                 
                 # 发送图片
@@ -205,20 +353,21 @@ class SysInfoCommand(PlusCommand):
     async def execute(self, args: CommandArgs) -> tuple[bool, str | None, bool]:
         """执行命令"""
         # 收集简要信息
-        cpu_p = psutil.cpu_percent(interval=None)
-        ram = psutil.virtual_memory()
+        stats = await get_stats()
+        cpu_p = stats['cpu']
+        ram = stats['ram']
         
         info = [
             "🖥️ **系统概览**",
             f"OS: {get_full_os_version()}",
             f"CPU: {cpu_p}%",
             f"RAM: {ram.percent}% ({ram.used / (1024**3):.1f}GB Used)",
-            f"Boot: {format_duration(int(time.time() - psutil.boot_time()))} ago"
+            f"Boot: {format_duration(int(time.time() - stats['boot_time']))} ago"
         ]
         
         # 磁盘
         info.append("\n💾 **磁盘状态**")
-        for disk in get_disk_info():
+        for disk in stats['disks']:
             info.append(f"- {disk['mountpoint']}: {disk['percent']}% ({disk['free_gb']:.1f}GB Free)")
             
         await self.send_text("\n".join(info))
@@ -240,28 +389,20 @@ class MemoryAnalysisCommand(PlusCommand):
         if not MEMORY_HISTORY:
             # 如果没有历史数据，先采集一次
             try:
-                process = psutil.Process(os.getpid())
-                mem = process.memory_info().rss / 1024 / 1024
+                mem = _SELF_PROC.memory_info().rss / 1024 / 1024
                 MEMORY_HISTORY.append(mem)
-            except:
+            except psutil.Error:
                 pass
         
         if not MEMORY_HISTORY:
              return True, "❌ 暂无内存数据", False
 
-        current = MEMORY_HISTORY[-1]
-        avg = sum(MEMORY_HISTORY) / len(MEMORY_HISTORY)
-        max_mem = max(MEMORY_HISTORY)
-        min_mem = min(MEMORY_HISTORY)
+        current, avg, max_mem, min_mem, recent_avg, old_avg = _trend_stats(MEMORY_HISTORY.view())
         
         # 趋势分析
         trend_str = "➡️ 相对平稳"
         if len(MEMORY_HISTORY) >= 5:
             # 比较最近5分钟和最早5分钟的平均值
-            history_list = list(MEMORY_HISTORY)
-            recent_avg = sum(history_list[-5:]) / len(history_list[-5:])
-            old_avg = sum(history_list[:5]) / len(history_list[:5])
-            
             diff = recent_avg - old_avg
             if diff > 10:
                 trend_str = "↗️ 明显上升 (可能存在泄漏)"
@@ -328,19 +469,45 @@ class MonitorStatusLitePlugin(BasePlugin):
         ]
 
     async def on_plugin_loaded(self):
-        """插件加载时启动内存记录任务"""
-        asyncio.create_task(self._memory_recorder())
+        """插件加载时启动内存记录与资源采样任务"""
+        # 保留任务引用，避免后台任务被垃圾回收
+        self._background_tasks = [
+            asyncio.create_task(self._memory_recorder()),
+            asyncio.create_task(self._stats_sampler()),
+        ]
+
+    @staticmethod
+    def _advance_schedule(next_t: float, interval: float) -> tuple[float, float]:
+        """按单调时钟推进调度点，返回 (下一次时间点, 需等待秒数)，每轮耗时不会累积成漂移"""
+        next_t += interval
+        now = time.monotonic()
+        if next_t < now:
+            # 落后超过一个周期 (如系统休眠) 时重新对齐，避免连续补采
+            next_t = now
+        return next_t, next_t - now
+
+    async def _stats_sampler(self):
+        """后台任务：定期采样CPU与内存占用率，命令直接读取最近一次结果"""
+        next_t = time.monotonic()
+        while True:
+            try:
+                _sample_cpu_ram()
+            except psutil.Error:
+                pass
+            next_t, delay = self._advance_schedule(next_t, STATS_SAMPLE_INTERVAL)
+            await asyncio.sleep(delay)
         
     async def _memory_recorder(self):
         """后台任务：每分钟记录一次内存"""
+        next_t = time.monotonic()
         while True:
             try:
-                process = psutil.Process(os.getpid())
-                mem = process.memory_info().rss / 1024 / 1024
+                mem = _SELF_PROC.memory_info().rss / 1024 / 1024
                 MEMORY_HISTORY.append(mem)
-            except Exception:
+            except psutil.Error:
                 pass
-            await asyncio.sleep(60)
+            next_t, delay = self._advance_schedule(next_t, MEMORY_RECORD_INTERVAL)
+            await asyncio.sleep(delay)
 
     permission_nodes: ClassVar[list[PermissionNodeField]] = [
         PermissionNodeField(